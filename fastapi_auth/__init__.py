@@ -11,7 +11,12 @@ This package provides:
 - Field-level encryption for sensitive data
 """
 
-from fastapi_auth.database.db import DatabaseSession, get_engine, get_session
+from fastapi_auth.database.db import (
+    DatabaseSession,
+    get_database_session,
+    get_engine,
+    get_session,
+)
 from fastapi_auth.models import get_metadata
 from fastapi_auth.routers.v1.auth_router import router as auth_router
 from fastapi_auth.settings import Settings, configure_settings, get_settings
@@ -23,6 +28,7 @@ __all__ = [
     "configure_settings",
     "get_settings",
     "DatabaseSession",
+    "get_database_session",
     "get_engine",
     "get_session",
     "auth_router",
@@ -8,7 +8,8 @@ from fastapi_auth.cli.utils import (
     run_async,
 )
 from fastapi_auth.models.user import User
-from fastapi_auth.schemas.user import UserSignupSchema
+from fastapi_auth.schemas.user import UserSignupSchema, normalize_email
+from fastapi_auth.settings import get_settings
 from fastapi_auth.utils.password import hash_password
 
 
@@ -21,6 +22,7 @@ def create_user(
     email: str, name: str | None, password: str | None, is_staff: bool
 ) -> None:
     """Create a new user."""
+    email = normalize_email(email)
 
     async def _create_user():
         async with get_db_session() as session:
@@ -40,7 +42,9 @@ def create_user(
                 password_value = password
 
             # Hash password (bcrypt.hashpw returns bytes, decode to string for storage)
-            hashed_password_bytes = hash_password(password_value)
+            hashed_password_bytes = hash_password(
+                password_value, settings=get_settings()
+            )
             # Handle both bytes and str return types (type hint says str but bcrypt returns bytes)
             if isinstance(hashed_password_bytes, bytes):
                 hashed_password = hashed_password_bytes.decode("utf-8")
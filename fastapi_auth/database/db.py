@@ -1,6 +1,8 @@
-import traceback
+from functools import lru_cache
+from typing import AsyncGenerator
 
-from fastapi.param_functions import Depends
+from fastapi import Request
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.ext.asyncio.engine import create_async_engine
 from sqlalchemy.ext.asyncio.session import async_sessionmaker
@@ -14,12 +16,30 @@ logger = get_logger(__name__)
 _engine = None
 
 
+def _get_pool_options(settings: Settings) -> dict:
+    """Build connection pool options for the engine from settings."""
+    options = {
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "pool_recycle": settings.db_pool_recycle,
+    }
+    # SQLite uses a static/single connection pool that does not accept sizing
+    if make_url(settings.database_url).get_backend_name() != "sqlite":
+        options.update(
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+        )
+    return options
+
+
 def get_engine():
     """Get or create the database engine."""
     global _engine
     if _engine is None:
         settings = get_settings()
-        _engine = create_async_engine(settings.database_url, echo=False)
+        _engine = create_async_engine(
+            settings.database_url, echo=False, **_get_pool_options(settings)
+        )
     return _engine
 
 
@@ -48,12 +68,31 @@ class DatabaseSession:
         try:
             async with self.SessionLocal() as session:
                 yield session
-        except Exception as e:
-            logger.error(f"Failed to get database session: {e}")
-            logger.error(traceback.format_exc())
+        except Exception:
+            logger.exception("Failed to get database session")
             if not self.fail_silently:
-                raise e
+                raise
+
+
+@lru_cache
+def get_database_session() -> DatabaseSession:
+    """
+    Get the process-wide DatabaseSession.
+
+    The session factory is built once and reused, so resolving a database
+    session per request does not rebuild the sessionmaker.
+    """
+    return DatabaseSession(get_settings())
+
 
+async def get_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Yield a session from the app's DatabaseSession.
 
-def get_session(settings: Settings = Depends(get_settings)) -> AsyncSession:
-    return DatabaseSession(settings).get_session()
+    Setting app.state.fastapi_auth_db is optional and only needed to point the
+    auth routes at a different DatabaseSession; by default the process-wide
+    one from get_database_session() is used.
+    """
+    db = getattr(request.app.state, "fastapi_auth_db", None) or get_database_session()
+    async with db.SessionLocal() as session:
+        yield session
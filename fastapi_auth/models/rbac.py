@@ -31,8 +31,10 @@ class UserRole(Base):
     user_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("auth_users.id"), primary_key=True
     )
+    # The primary key leads with user_id, so lookups from the role side need their
+    # own index
     role_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("auth_roles.id"), primary_key=True
+        Integer, ForeignKey("auth_roles.id"), primary_key=True, index=True
     )
     # Override id to be part of composite primary key but still autoincrement
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -61,8 +63,10 @@ class RolePermission(Base):
     role_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("auth_roles.id"), primary_key=True
     )
+    # The primary key leads with role_id, so lookups from the permission side need
+    # their own index
     permission_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("auth_permissions.id"), primary_key=True
+        Integer, ForeignKey("auth_permissions.id"), primary_key=True, index=True
     )
     # Override id to be part of composite primary key but still autoincrement
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -5,6 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi_auth.database.db import get_session
 from fastapi_auth.models import User
 from fastapi_auth.models.rbac import Permission, Role
+from fastapi_auth.schemas.user import normalize_email
 
 
 class RBACRepository:
@@ -22,7 +23,9 @@ class RBACRepository:
         return result.scalars().all()
 
     async def get_roles_by_user_email(self, email: str) -> list[Role]:
-        statement = select(Role).join(Role.users).where(User.email == email)
+        statement = (
+            select(Role).join(Role.users).where(User.email == normalize_email(email))
+        )
         result = await self.database.execute(statement=statement)
         return result.scalars().all()
 
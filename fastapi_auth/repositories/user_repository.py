@@ -1,36 +1,79 @@
 from fastapi import Depends
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from fastapi_auth.database.db import get_session
 from fastapi_auth.models.user import User
-from fastapi_auth.schemas.user import UserSignupSchema
+from fastapi_auth.schemas.user import UserSignupSchema, normalize_email
+
+# The auth path only reads columns of the user; roles and permissions are
+# fetched through RBACRepository when needed. Relationships raise on access
+# instead of silently issuing an extra query.
+_user_load_options = (raiseload("*"),)
+
+# Lookup statements are built once and reused with bound parameters so the hot
+# auth path does not rebuild the query (and its cache key) on every call
+_get_user_by_email_statement = (
+    select(User).options(*_user_load_options).where(User.email == bindparam("email"))
+)
+_get_user_by_id_statement = (
+    select(User).options(*_user_load_options).where(User.id == bindparam("user_id"))
+)
 
 
 class UserRepository:
     def __init__(self, database: AsyncSession):
         self.database = database
 
-    async def create_user(self, user: UserSignupSchema):
-        new_user = User(
-            email=user.email,
-            name=user.name,
-            profile_pic=user.profile_pic,
-            password=user.password,
+    async def create_user(self, user: UserSignupSchema) -> User | None:
+        # Returns None when the email is already taken; callers decide whether
+        # that is an error (signup) or a reason to look the user up instead
+        values = {
+            "email": user.email,
+            "name": user.name,
+            "profile_pic": user.profile_pic,
+            "password": user.password,
+        }
+        if self.database.get_bind().dialect.name != "postgresql":
+            new_user = User(**values)
+            self.database.add(new_user)
+            try:
+                await self.database.commit()
+            except IntegrityError:
+                await self.database.rollback()
+                return None
+            await self.database.refresh(new_user)
+            return new_user
+
+        # Insert and read back the row in a single roundtrip. If the email is
+        # already taken nothing is inserted and no row comes back.
+        statement = (
+            postgresql.insert(User)
+            .values(**values)
+            .on_conflict_do_nothing(index_elements=[User.email])
+            .returning(User)
         )
-        self.database.add(new_user)
+        result = await self.database.execute(statement=statement)
+        new_user = result.scalar_one_or_none()
         await self.database.commit()
-        await self.database.refresh(new_user)
-        return await self.get_user_by_email(email=user.email)
+        return new_user
 
     async def get_user_by_email(self, email: str) -> User | None:
-        statement = select(User).where(User.email == email)
-        result = await self.database.execute(statement=statement)
+        # Stored emails are lowercased; callers such as token lookups may pass
+        # the raw value
+        result = await self.database.execute(
+            statement=_get_user_by_email_statement,
+            params={"email": normalize_email(email)},
+        )
         return result.scalar_one_or_none()
 
     async def get_user_by_id(self, user_id: int) -> User | None:
-        statement = select(User).where(User.id == user_id)
-        result = await self.database.execute(statement=statement)
+        result = await self.database.execute(
+            statement=_get_user_by_id_statement, params={"user_id": user_id}
+        )
         return result.scalar_one_or_none()
 
 
@@ -1,23 +1,34 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
+from pydantic import BaseModel
 
 from fastapi_auth.models.social_providers import SupportedProviders
-from fastapi_auth.schemas.user import UserSignupSchema
+from fastapi_auth.schemas.user import (
+    UserJWTResponseSchema,
+    UserSignupResponseSchema,
+    UserSignupSchema,
+)
 from fastapi_auth.services.user_service import UserService, get_user_service
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
-@router.post("/signup")
+def _json_response(model: BaseModel) -> Response:
+    # Serialize with pydantic-core directly instead of FastAPI's
+    # jsonable_encoder + json.dumps pass over the returned model
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
+@router.post("/signup", response_model=UserJWTResponseSchema | UserSignupResponseSchema)
 async def signup(
     payload: UserSignupSchema, user_service: UserService = Depends(get_user_service)
 ):
-    return await user_service.signup_user(payload)
+    return _json_response(await user_service.signup_user(payload))
 
 
-@router.post("/social/{provider_type}/login")
+@router.post("/social/{provider_type}/login", response_model=UserJWTResponseSchema)
 async def social_login(
     provider_type: SupportedProviders,
     payload: dict,
     user_service: UserService = Depends(get_user_service),
 ):
-    return await user_service.social_login(provider_type, **payload)
+    return _json_response(await user_service.social_login(provider_type, **payload))
@@ -1,12 +1,20 @@
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
+
+
+def normalize_email(email: str) -> str:
+    return email.strip().lower()
 
 
 class UserPasswordLoginSchema(BaseModel):
     email: str
     password: Optional[str] = None
 
+    # Emails are stored lowercased so lookups hit the unique index directly
+    # instead of needing lower() in the WHERE clause
+    _normalize_email = field_validator("email")(normalize_email)
+
 
 class UserSignupSchema(BaseModel):
     email: str
@@ -14,6 +22,8 @@ class UserSignupSchema(BaseModel):
     name: Optional[str] = None
     profile_pic: Optional[str] = None
 
+    _normalize_email = field_validator("email")(normalize_email)
+
 
 class UserJWTResponseSchema(BaseModel):
     access_token: str
@@ -3,7 +3,7 @@ from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from fastapi_auth.database.db import DatabaseSession
+from fastapi_auth.database.db import get_database_session
 from fastapi_auth.models.user import User
 from fastapi_auth.repositories.rbac_repository import (
     RBACRepository,
@@ -14,6 +14,7 @@ from fastapi_auth.repositories.user_repository import (
     get_user_repository,
 )
 from fastapi_auth.settings import Settings, get_settings
+from fastapi_auth.utils.jwt import verify_jwt_token_cached
 from fastapi_auth.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -34,11 +35,7 @@ async def _get_user_from_jwt(
             headers={"WWW-Authenticate": "Bearer"},
         )
     try:
-        jwt_secret = config.jwt_secret_key
-        algorithm = config.jwt_algorithm
-        payload = jwt.decode(
-            credentials.credentials, jwt_secret, algorithms=[algorithm]
-        )
+        payload = verify_jwt_token_cached(credentials.credentials, config)
         # Try to get user_id from payload, fallback to email
         user_id = payload.get("id")
         if user_id:
@@ -192,9 +189,7 @@ async def _get_user_from_token(
         HTTPException: If authentication fails
     """
     try:
-        jwt_secret = config.jwt_secret_key
-        algorithm = config.jwt_algorithm
-        payload = jwt.decode(token, jwt_secret, algorithms=[algorithm])
+        payload = verify_jwt_token_cached(token, config)
 
         # Try to get user_id from payload, fallback to email
         user_id = payload.get("id")
@@ -282,7 +277,7 @@ async def _get_user_from_request(
         return await _get_user_from_token(token, config, user_repo)
     else:
         # Create our own session for backward compatibility
-        db_session = DatabaseSession(config)
+        db_session = get_database_session()
 
         async with db_session.SessionLocal() as session:
             user_repo = UserRepository(database=session)
@@ -291,7 +286,7 @@ async def _get_user_from_request(
 
 async def check_admin_from_request(request: Request) -> User:
     """Check if user from request has admin role. Returns User or raises HTTPException."""
-    db_session = DatabaseSession(get_settings())
+    db_session = get_database_session()
 
     async with db_session.SessionLocal() as session:
         user = await _get_user_from_request(request, session=session)
@@ -309,7 +304,7 @@ async def check_admin_from_request(request: Request) -> User:
 
 async def check_role_from_request(request: Request, role_name: str) -> User:
     """Check if user from request has required role. Returns User or raises HTTPException."""
-    db_session = DatabaseSession(get_settings())
+    db_session = get_database_session()
 
     async with db_session.SessionLocal() as session:
         user = await _get_user_from_request(request, session=session)
@@ -335,7 +330,7 @@ async def check_permissions_from_request(
     request: Request, permission_names: list[str]
 ) -> User:
     """Check if user from request has required permissions. Returns User or raises HTTPException."""
-    db_session = DatabaseSession(get_settings())
+    db_session = get_database_session()
 
     async with db_session.SessionLocal() as session:
         user = await _get_user_from_request(request, session=session)
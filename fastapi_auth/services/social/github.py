@@ -73,14 +73,20 @@ class GithubSocialProvider:
             raise HTTPException(status_code=400, detail="Github is not configured.")
         token = await self.exchange_code_for_token(code=code)
         user_info = await self.get_user_info(token=token)
-        user = await self.user_repository.create_user(
-            user=UserSignupSchema(
-                email=user_info.email,
-                name=user_info.name,
-                profile_pic=str(user_info.avatar_url) if user_info.avatar_url else None,
-            )
+        user_signup = UserSignupSchema(
+            email=user_info.email,
+            name=user_info.name,
+            profile_pic=str(user_info.avatar_url) if user_info.avatar_url else None,
         )
 
+        # Returning GitHub users log into the account that owns their email
+        user = await self.user_repository.get_user_by_email(email=user_signup.email)
+        if user is None:
+            user = await self.user_repository.create_user(user=user_signup)
+        # A concurrent login may have created the user after the lookup
+        if user is None:
+            user = await self.user_repository.get_user_by_email(email=user_signup.email)
+
         return generate_jwt_token(user=user, settings=self.settings)
 
     async def login(self, **kwargs):
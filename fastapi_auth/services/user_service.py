@@ -1,4 +1,5 @@
 from fastapi import Depends, HTTPException
+from starlette.concurrency import run_in_threadpool
 
 from fastapi_auth.models.social_providers import SupportedProviders
 from fastapi_auth.repositories.user_repository import (
@@ -14,7 +15,11 @@ from fastapi_auth.schemas.user import (
 from fastapi_auth.services.social import provider_maps
 from fastapi_auth.settings import Settings, get_settings
 from fastapi_auth.utils.jwt import generate_jwt_token
-from fastapi_auth.utils.password import verify_password
+from fastapi_auth.utils.password import (
+    hash_password,
+    verify_dummy_password,
+    verify_password,
+)
 
 
 class UserService:
@@ -41,11 +46,16 @@ class UserService:
     ) -> UserJWTResponseSchema:
         user = await self.repository.get_user_by_email(email=user_login.email)
 
-        # If the user deos not exist, raise an exception
+        # If the user does not exist, spend the same bcrypt time as a real check
+        # and fail like a wrong password, so the response does not reveal
+        # whether the email is registered
         if not user:
-            raise HTTPException(
-                status_code=404, detail="No user exists with the given email."
+            await run_in_threadpool(
+                verify_dummy_password,
+                password=user_login.password or "",
+                settings=self.settings,
             )
+            raise HTTPException(status_code=401, detail="Invalid credentials")
 
         # See if this is a passwordless login
         if self.settings.passwordless_login_enabled:
@@ -54,9 +64,9 @@ class UserService:
         if not user.password:
             raise HTTPException(status_code=400, detail="Password is required.")
 
-        # Verify the password
-        if not verify_password(
-            password=user_login.password, hashed_password=user.password
+        # Verify the password, bcrypt is CPU bound so keep it off the event loop
+        if not await run_in_threadpool(
+            verify_password, password=user_login.password, hashed_password=user.password
         ):
             raise HTTPException(status_code=401, detail="Invalid credentials")
 
@@ -84,9 +94,20 @@ class UserService:
                 message="OTP sent to email for verification."
             )
 
+        # Hash the password off the event loop before storing it
+        if user_signup.password:
+            hashed_password = await run_in_threadpool(
+                hash_password, password=user_signup.password, settings=self.settings
+            )
+            user_signup = user_signup.model_copy(update={"password": hashed_password})
+
         # Create the user
         created_user = await self.repository.create_user(user=user_signup)
 
+        # Another signup may have taken the email since the lookup above
+        if created_user is None:
+            raise HTTPException(status_code=400, detail="User already exists.")
+
         # Generate a jwt for the user and return
         return generate_jwt_token(user=created_user, settings=self.settings)
 
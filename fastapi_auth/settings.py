@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import Any, Dict, Literal, Optional, Union
 
 from cryptography.fernet import Fernet
+from pydantic import Field
 from pydantic_extra_types.timezone_name import TimeZoneName
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -20,6 +21,13 @@ class Settings(BaseSettings):
     timezone: TimeZoneName = "UTC"
     project_name: str = "oblox-fastapi-auth"
 
+    # Database Connection Pool Settings
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_timeout: int = 30  # seconds
+    db_pool_recycle: int = 1800  # 30 minutes
+    db_pool_pre_ping: bool = True
+
     # JWT Settings
     jwt_secret_key: str = "sample-secret-key-dont-use-in-production"
     jwt_algorithm: str = "HS256"
@@ -60,6 +68,7 @@ class Settings(BaseSettings):
 
     # Auth settings for password, emails etc
     passwordless_login_enabled: bool = False
+    bcrypt_rounds: int = Field(12, ge=4, le=31)  # log2 of the bcrypt work factor
     email_verification_required: bool = False
 
     model_config = SettingsConfigDict(
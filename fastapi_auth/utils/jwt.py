@@ -1,48 +1,135 @@
-import datetime
-from datetime import timedelta
-from zoneinfo import ZoneInfo
+import base64
+import hashlib
+import hmac
+import json
+import time
+from functools import lru_cache
+from typing import Any
 
 import jwt
+from cachetools import TLRUCache
 from fastapi import HTTPException
 
 from fastapi_auth.models.user import User
 from fastapi_auth.schemas.user import UserJWTResponseSchema
 from fastapi_auth.settings import Settings
 
+# HMAC algorithms signed directly here; anything else is delegated to PyJWT
+_HMAC_DIGESTS = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512,
+}
+
+
+def _base64url_encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+# The JOSE header only depends on the algorithm, so it is serialized once. The
+# layout matches PyJWT's, which keeps the produced tokens byte-for-byte identical.
+_JWT_HEADERS = {
+    algorithm: _base64url_encode(
+        json.dumps(
+            {"alg": algorithm, "typ": "JWT"}, separators=(",", ":"), sort_keys=True
+        ).encode()
+    )
+    for algorithm in _HMAC_DIGESTS
+}
+
+
+@lru_cache(maxsize=8)
+def _get_hmac_template(secret_key: str, algorithm: str) -> hmac.HMAC:
+    """Keyed HMAC that is copied per token instead of re-deriving the key pads."""
+    return hmac.new(secret_key.encode(), digestmod=_HMAC_DIGESTS[algorithm])
+
+
+def _encode_jwt(payload: dict[str, Any], settings: Settings) -> str:
+    algorithm = settings.jwt_algorithm
+    if algorithm not in _HMAC_DIGESTS:
+        return jwt.encode(payload, settings.jwt_secret_key, algorithm=algorithm)
+
+    body = _base64url_encode(json.dumps(payload, separators=(",", ":")).encode())
+    signing_input = _JWT_HEADERS[algorithm] + b"." + body
+    signature = _get_hmac_template(settings.jwt_secret_key, algorithm).copy()
+    signature.update(signing_input)
+    return (signing_input + b"." + _base64url_encode(signature.digest())).decode()
+
 
 def generate_jwt_token(user: User, settings: Settings) -> UserJWTResponseSchema:
-    tz = ZoneInfo(settings.timezone)
+    now = int(time.time())
     payload = {
         "iss": settings.project_name,
         "sub": user.email,
         "aud": settings.jwt_audience,
-        "exp": datetime.datetime.now(tz=tz)
-        + timedelta(minutes=settings.jwt_access_token_expire_minutes),
+        "exp": now + settings.jwt_access_token_expire_minutes * 60,
     }
-    access_token = jwt.encode(
-        payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm
-    )
-    payload.update(
-        {
-            "exp": datetime.datetime.now(tz=tz)
-            + timedelta(minutes=settings.jwt_refresh_token_expire_minutes),
-        }
+    access_token = _encode_jwt(payload, settings)
+    payload["exp"] = now + settings.jwt_refresh_token_expire_minutes * 60
+    refresh_token = _encode_jwt(payload, settings)
+    return UserJWTResponseSchema(access_token=access_token, refresh_token=refresh_token)
+
+
+# Successfully decoded tokens are kept for at most this many seconds
+_TOKEN_CACHE_TTL = 30
+
+
+def _token_ttu(key: str, payload: dict[str, Any], now: float) -> float:
+    """Expire a cached payload after the cache TTL or when the token expires."""
+    ttl = _TOKEN_CACHE_TTL
+    if "exp" in payload:
+        ttl = min(ttl, payload["exp"] - time.time())
+    return now + ttl
+
+
+_token_cache: TLRUCache = TLRUCache(maxsize=10000, ttu=_token_ttu)
+
+
+def _token_cache_key(token: str, settings: Settings, audience: str | None) -> str:
+    # The verification parameters are part of the key so a token accepted under
+    # one secret/audience is never served from cache for another
+    material = "\0".join(
+        [settings.jwt_secret_key, settings.jwt_algorithm, audience or "", token]
     )
-    refresh_token = jwt.encode(
-        payload,
+    return hashlib.sha256(material.encode()).hexdigest()[:32]
+
+
+def verify_jwt_token_cached(
+    token: str, settings: Settings, audience: str | None = None
+) -> dict[str, Any]:
+    """
+    Decode a JWT, reusing the payload of recently verified tokens.
+
+    Only successfully decoded tokens are cached, so invalid or expired tokens are
+    re-checked on every call and raise the usual `jwt.InvalidTokenError` subclasses.
+
+    Args:
+        token: Encoded JWT
+        settings: Settings object with JWT configuration
+        audience: Expected audience, or None to skip audience verification
+
+    Returns:
+        The decoded token payload
+    """
+    key = _token_cache_key(token, settings, audience)
+    payload = _token_cache.get(key)
+    if payload is not None:
+        return payload
+
+    payload = jwt.decode(
+        token,
         settings.jwt_secret_key,
-        algorithm=settings.jwt_algorithm,
+        algorithms=[settings.jwt_algorithm],
+        audience=audience,
     )
-    return UserJWTResponseSchema(access_token=access_token, refresh_token=refresh_token)
+    _token_cache[key] = payload
+    return payload
 
 
 def verify_jwt_token(token: str, settings: Settings) -> User:
     try:
-        payload = jwt.decode(
-            token,
-            settings.jwt_secret_key,
-            algorithms=[settings.jwt_algorithm],
-            audience=settings.jwt_audience,
+        payload = verify_jwt_token_cached(
+            token, settings, audience=settings.jwt_audience
         )
         return User(email=payload["sub"])
     except jwt.ExpiredSignatureError:
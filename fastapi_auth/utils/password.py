@@ -1,9 +1,30 @@
+from functools import lru_cache
+
 import bcrypt
 
+from fastapi_auth.settings import Settings
+
 
-def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+def hash_password(password: str, settings: Settings) -> str:
+    salt = bcrypt.gensalt(rounds=settings.bcrypt_rounds)
+    return bcrypt.hashpw(password.encode(), salt).decode()
 
 
 def verify_password(password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(password.encode(), hashed_password.encode())
+
+
+@lru_cache
+def _get_dummy_hash(rounds: int) -> str:
+    return bcrypt.hashpw(b"dummy-password", bcrypt.gensalt(rounds=rounds)).decode()
+
+
+def verify_dummy_password(password: str, settings: Settings) -> bool:
+    """
+    Check a password against a throwaway hash and always fail.
+
+    Used when no user matches a login so that the request takes as long as a real
+    password check. The dummy hash is computed once per work factor.
+    """
+    verify_password(password, _get_dummy_hash(settings.bcrypt_rounds))
+    return False
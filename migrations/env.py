@@ -7,19 +7,15 @@ from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.types import TypeDecorator
 
-# Import models module to ensure all model tables are registered in Base.metadata
+# Importing fastapi_auth.models registers every model table on Base.metadata.
 # In SQLAlchemy's declarative system, tables are registered only when their
-# defining classes are imported. Without this import, Base.metadata remains empty.
-import fastapi_auth.models  # noqa: F401  # ensure model tables are registered
-from fastapi_auth.models.base import Base
+# defining classes are imported. Without this, Base.metadata remains empty.
+from fastapi_auth.models import get_metadata
 
 # IMPORTANT: Configure settings programmatically BEFORE importing models
 # This ensures proper initialization of settings-dependent components
 from fastapi_auth.settings import get_settings
 
-# Import Base model for this package's metadata
-
-
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
@@ -45,8 +41,8 @@ if config.config_file_name is not None:
 # fastapi_auth models. Always configure settings programmatically before
 # importing models (see configure_settings() call above).
 #
-# For this package's own migrations, we only use Base.metadata:
-target_metadata = Base.metadata
+# For this package's own migrations, we only use this package's metadata:
+target_metadata = get_metadata()
 
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
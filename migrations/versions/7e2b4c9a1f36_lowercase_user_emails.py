@@ -0,0 +1,34 @@
+"""lowercase user emails
+
+Revision ID: 7e2b4c9a1f36
+Revises: 3c9a1e5b7d20
+Create Date: 2026-10-15 20:41:07.204913
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7e2b4c9a1f36"
+down_revision: Union[str, Sequence[str], None] = "3c9a1e5b7d20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Emails are now normalized on input, so existing rows must match for
+    # lookups to keep using the unique index on email
+    op.execute(
+        "UPDATE auth_users SET email = lower(trim(email)) "
+        "WHERE email <> lower(trim(email))"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The original casing is not recoverable
+    pass
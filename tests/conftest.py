@@ -256,7 +256,7 @@ async def test_user(db_session: AsyncSession, mock_user_data):
     user = User(
         email=mock_user_data["email"],
         name=mock_user_data["name"],
-        password=hash_password(mock_user_data["password"])
+        password=hash_password(mock_user_data["password"], settings=get_settings())
         if mock_user_data["password"]
         else None,
         profile_pic=mock_user_data["profile_pic"],
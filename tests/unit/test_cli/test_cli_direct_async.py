@@ -27,6 +27,7 @@ class TestCLIDirectAsyncFunctions:
         from sqlalchemy import select
 
         from fastapi_auth.schemas.user import UserSignupSchema
+        from fastapi_auth.settings import get_settings
         from fastapi_auth.utils.password import hash_password
 
         # Check if user exists
@@ -35,7 +36,7 @@ class TestCLIDirectAsyncFunctions:
         assert existing_user is None  # Should not exist
 
         # Hash password
-        hashed_password_bytes = hash_password(password)
+        hashed_password_bytes = hash_password(password, get_settings())
         if isinstance(hashed_password_bytes, bytes):
             hashed_password = hashed_password_bytes.decode("utf-8")
         else:
@@ -70,10 +71,11 @@ class TestCLIDirectAsyncFunctions:
     @pytest.mark.asyncio
     async def test_create_user_internal_hash_bytes_path(self, test_session):
         """Test create user internal with bytes hash path."""
+        from fastapi_auth.settings import get_settings
         from fastapi_auth.utils.password import hash_password
 
         password = "testpass123"
-        hashed = hash_password(password)
+        hashed = hash_password(password, get_settings())
 
         # Test bytes path
         if isinstance(hashed, bytes):
@@ -3,10 +3,12 @@
 from unittest.mock import Mock, patch
 
 import pytest
+from starlette.datastructures import State
 
 from fastapi_auth.database.db import (
     DatabaseSession,
     _EngineProxy,
+    get_database_session,
     get_engine,
     get_session,
 )
@@ -47,6 +49,46 @@ class TestDatabaseModule:
             # Should only be called once
             assert mock_create.call_count == 1
 
+    def test_get_engine_configures_connection_pool(self, mock_settings):
+        """Test get_engine passes pool settings to create_async_engine."""
+        import fastapi_auth.database.db as db_module
+
+        db_module._engine = None
+
+        with (
+            patch("fastapi_auth.database.db.get_settings", return_value=mock_settings),
+            patch("fastapi_auth.database.db.create_async_engine") as mock_create,
+        ):
+            get_engine()
+
+        _, kwargs = mock_create.call_args
+        assert kwargs["pool_size"] == mock_settings.db_pool_size
+        assert kwargs["max_overflow"] == mock_settings.db_max_overflow
+        assert kwargs["pool_timeout"] == mock_settings.db_pool_timeout
+        assert kwargs["pool_recycle"] == mock_settings.db_pool_recycle
+        assert kwargs["pool_pre_ping"] is True
+        db_module._engine = None
+
+    def test_get_engine_skips_pool_sizing_for_sqlite(self, mock_settings):
+        """Test get_engine does not pass pool sizing options for SQLite."""
+        import fastapi_auth.database.db as db_module
+
+        db_module._engine = None
+        settings = mock_settings.model_copy(
+            update={"database_url": "sqlite+aiosqlite:///:memory:"}
+        )
+
+        with (
+            patch("fastapi_auth.database.db.get_settings", return_value=settings),
+            patch("fastapi_auth.database.db.create_async_engine") as mock_create,
+        ):
+            get_engine()
+
+        _, kwargs = mock_create.call_args
+        assert "pool_size" not in kwargs
+        assert "max_overflow" not in kwargs
+        db_module._engine = None
+
     def test_engine_proxy_getattr(self):
         """Test _EngineProxy __getattr__ method."""
         proxy = _EngineProxy()
@@ -167,15 +209,89 @@ class TestDatabaseModule:
                 except ValueError:
                     pytest.fail("Should not raise exception when fail_silently=True")
 
-    def test_get_session_dependency(self):
-        """Test get_session dependency function."""
-        with patch("fastapi_auth.database.db.get_settings") as mock_get_settings:
-            mock_settings = Mock()
-            mock_get_settings.return_value = mock_settings
+    def test_get_database_session_is_cached(self):
+        """Test get_database_session builds the DatabaseSession only once."""
+        get_database_session.cache_clear()
 
-            with patch("fastapi_auth.database.db.DatabaseSession") as mock_db_session:
-                result = get_session(mock_settings)
+        with patch("fastapi_auth.database.db.DatabaseSession") as mock_db_session:
+            first = get_database_session()
+            second = get_database_session()
+
+        assert first is second
+        mock_db_session.assert_called_once()
+        get_database_session.cache_clear()
+
+    @pytest.mark.asyncio
+    async def test_get_session_dependency(self):
+        """Test get_session yields a session from the shared DatabaseSession."""
+        mock_session = Mock()
 
-                # Should return async generator
-                assert result is not None
-                mock_db_session.assert_called_once_with(mock_settings)
+        class AsyncContextManager:
+            async def __aenter__(self):
+                return mock_session
+
+            async def __aexit__(self, exc_type, exc_val, exc_tb):
+                return None
+
+        mock_db_session = Mock()
+        mock_db_session.SessionLocal.return_value = AsyncContextManager()
+        request = Mock()
+        request.app.state = State()
+
+        with patch(
+            "fastapi_auth.database.db.get_database_session",
+            return_value=mock_db_session,
+        ):
+            async for session in get_session(request):
+                assert session is mock_session
+
+        mock_db_session.SessionLocal.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_session_prefers_app_state_db(self):
+        """Test get_session uses a DatabaseSession stored on app.state."""
+        mock_session = Mock()
+
+        class AsyncContextManager:
+            async def __aenter__(self):
+                return mock_session
+
+            async def __aexit__(self, exc_type, exc_val, exc_tb):
+                return None
+
+        app_db_session = Mock()
+        app_db_session.SessionLocal.return_value = AsyncContextManager()
+        request = Mock()
+        request.app.state = State()
+        request.app.state.fastapi_auth_db = app_db_session
+
+        with patch("fastapi_auth.database.db.get_database_session") as mock_get:
+            async for session in get_session(request):
+                assert session is mock_session
+
+        mock_get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_session_ignores_app_state_db(self):
+        """Test get_session does not pick up an unrelated app.state.db."""
+        mock_session = Mock()
+
+        class AsyncContextManager:
+            async def __aenter__(self):
+                return mock_session
+
+            async def __aexit__(self, exc_type, exc_val, exc_tb):
+                return None
+
+        mock_db_session = Mock()
+        mock_db_session.SessionLocal.return_value = AsyncContextManager()
+        request = Mock()
+        request.app.state = State()
+        request.app.state.db = object()
+
+        with patch(
+            "fastapi_auth.database.db.get_database_session",
+            return_value=mock_db_session,
+        ):
+            async for session in get_session(request):
+                assert session is mock_session
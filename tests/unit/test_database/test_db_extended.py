@@ -39,3 +39,32 @@ class TestDatabaseExtended:
                 with pytest.raises(ValueError, match="Database connection failed"):
                     async for _ in session_obj2.get_session():
                         pass
+
+    @pytest.mark.asyncio
+    async def test_database_session_get_session_reraises_original_error(
+        self, mock_settings
+    ):
+        """Test DatabaseSession.get_session logs and re-raises the same error."""
+        with patch("fastapi_auth.database.db.get_engine"):
+            test_error = ValueError("Database connection failed")
+            mock_context = AsyncMock()
+            mock_context.__aenter__ = AsyncMock(side_effect=test_error)
+            mock_context.__aexit__ = AsyncMock(return_value=None)
+            mock_session_maker = Mock(return_value=mock_context)
+
+            with (
+                patch(
+                    "fastapi_auth.database.db.async_sessionmaker",
+                    return_value=mock_session_maker,
+                ),
+                patch("fastapi_auth.database.db.logger") as mock_logger,
+            ):
+                session_obj = DatabaseSession(mock_settings, fail_silently=False)
+                with pytest.raises(ValueError) as exc_info:
+                    async for _ in session_obj.get_session():
+                        pass
+
+            assert exc_info.value is test_error
+            mock_logger.exception.assert_called_once_with(
+                "Failed to get database session"
+            )
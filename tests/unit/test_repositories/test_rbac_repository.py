@@ -79,6 +79,28 @@ class TestRBACRepositoryGetRolesByUserId:
         assert roles == []
 
 
+class TestRBACRepositoryGetRolesByUserEmail:
+    """Test RBACRepository get_roles_by_user_email method."""
+
+    @pytest.mark.asyncio
+    async def test_get_roles_by_user_email_normalizes_lookup(
+        self, db_session, test_user
+    ):
+        """Test get_roles_by_user_email matches stored emails regardless of case."""
+        repository = RBACRepository(db_session)
+
+        role = Role(name="editor", description="Editor role")
+        db_session.add(role)
+        await db_session.commit()
+        await db_session.refresh(role)
+        db_session.add(UserRole(user_id=test_user.id, role_id=role.id))
+        await db_session.commit()
+
+        roles = await repository.get_roles_by_user_email(email=test_user.email.upper())
+
+        assert [r.name for r in roles] == ["editor"]
+
+
 class TestRBACRepositoryGetPermissionsByUserId:
     """Test RBACRepository get_permissions_by_user_id method."""
 
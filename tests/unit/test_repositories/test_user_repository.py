@@ -1,4 +1,7 @@
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
+from sqlalchemy.exc import IntegrityError, InvalidRequestError
 
 from fastapi_auth.repositories.user_repository import UserRepository
 from fastapi_auth.schemas.user import UserSignupSchema
@@ -46,6 +49,64 @@ class TestUserRepositoryCreateUser:
         assert created_user.name is None
         assert created_user.profile_pic is None
 
+    @pytest.mark.asyncio
+    async def test_create_user_returns_none_on_conflict(self, db_session, test_user):
+        """Test create_user returns None instead of the user owning the email."""
+        repository = UserRepository(db_session)
+
+        user_signup = UserSignupSchema(email=test_user.email, name="Someone Else")
+
+        assert await repository.create_user(user_signup) is None
+
+        existing_user = await repository.get_user_by_email(email=test_user.email)
+        assert existing_user.name == test_user.name
+
+    @pytest.mark.asyncio
+    async def test_create_user_returns_none_on_conflict_without_postgres(self):
+        """Test the non-Postgres path rolls back and returns None on conflict."""
+        database = MagicMock()
+        database.get_bind.return_value.dialect.name = "mysql"
+        database.commit = AsyncMock(
+            side_effect=IntegrityError("INSERT", {}, Exception("duplicate"))
+        )
+        database.rollback = AsyncMock()
+        database.refresh = AsyncMock()
+        repository = UserRepository(database)
+
+        created_user = await repository.create_user(
+            UserSignupSchema(email="taken@example.com")
+        )
+
+        assert created_user is None
+        database.rollback.assert_awaited_once()
+        database.refresh.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_create_user_uses_single_statement(self, test_engine, db_session):
+        """Test create_user inserts and reads back the user in one statement."""
+        from sqlalchemy import event
+
+        repository = UserRepository(db_session)
+        statements = []
+
+        def count_statements(conn, cursor, statement, parameters, context, many):
+            statements.append(statement)
+
+        event.listen(test_engine.sync_engine, "before_cursor_execute", count_statements)
+        try:
+            created_user = await repository.create_user(
+                UserSignupSchema(email="single@example.com")
+            )
+        finally:
+            event.remove(
+                test_engine.sync_engine, "before_cursor_execute", count_statements
+            )
+
+        assert created_user.id is not None
+        assert created_user.created_at is not None
+        assert len(statements) == 1
+        assert "RETURNING" in statements[0]
+
 
 class TestUserRepositoryGetUserByEmail:
     """Test UserRepository get_user_by_email method."""
@@ -72,6 +133,31 @@ class TestUserRepositoryGetUserByEmail:
 
         assert found_user is None
 
+    @pytest.mark.asyncio
+    async def test_get_user_by_email_normalizes_lookup(self, db_session, test_user):
+        """Test get_user_by_email matches stored emails regardless of case."""
+        repository = UserRepository(db_session)
+
+        found_user = await repository.get_user_by_email(
+            email=f"  {test_user.email.upper()} "
+        )
+
+        assert found_user is not None
+        assert found_user.id == test_user.id
+
+    @pytest.mark.asyncio
+    async def test_get_user_by_email_raises_on_relationship_access(
+        self, db_session, test_user
+    ):
+        """Test relationships are not loaded and raise instead of lazy loading."""
+        repository = UserRepository(db_session)
+        db_session.expunge_all()
+
+        found_user = await repository.get_user_by_email(email=test_user.email)
+
+        with pytest.raises(InvalidRequestError):
+            _ = found_user.roles
+
 
 class TestUserRepositoryGetUserById:
     """Test UserRepository get_user_by_id method."""
@@ -536,7 +536,9 @@ class TestGetUserFromRequest:
         with patch(
             "fastapi_auth.services.rbac.get_settings", return_value=mock_settings
         ):
-            with patch("fastapi_auth.services.rbac.DatabaseSession") as mock_db_session:
+            with patch(
+                "fastapi_auth.services.rbac.get_database_session"
+            ) as mock_db_session:
                 mock_db_session_instance = MagicMock()
                 mock_db_session_instance.SessionLocal = MagicMock(
                     return_value=async_context_manager
@@ -611,7 +613,9 @@ class TestGetUserFromRequest:
         with patch(
             "fastapi_auth.services.rbac.get_settings", return_value=mock_settings
         ):
-            with patch("fastapi_auth.services.rbac.DatabaseSession") as mock_db_session:
+            with patch(
+                "fastapi_auth.services.rbac.get_database_session"
+            ) as mock_db_session:
                 mock_db_session_instance = MagicMock()
                 mock_db_session_instance.SessionLocal = MagicMock(
                     return_value=async_context_manager
@@ -664,7 +668,9 @@ class TestCheckAdminFromRequest:
         with patch(
             "fastapi_auth.services.rbac.get_settings", return_value=mock_settings
         ):
-            with patch("fastapi_auth.services.rbac.DatabaseSession") as mock_db_session:
+            with patch(
+                "fastapi_auth.services.rbac.get_database_session"
+            ) as mock_db_session:
                 mock_db_session_instance = MagicMock()
                 mock_db_session_instance.SessionLocal = MagicMock(
                     return_value=async_context_manager
@@ -716,7 +722,9 @@ class TestCheckAdminFromRequest:
         with patch(
             "fastapi_auth.services.rbac.get_settings", return_value=mock_settings
         ):
-            with patch("fastapi_auth.services.rbac.DatabaseSession") as mock_db_session:
+            with patch(
+                "fastapi_auth.services.rbac.get_database_session"
+            ) as mock_db_session:
                 mock_db_session_instance = MagicMock()
                 mock_db_session_instance.SessionLocal = MagicMock(
                     return_value=async_context_manager
@@ -774,7 +782,9 @@ class TestCheckRoleFromRequest:
         with patch(
             "fastapi_auth.services.rbac.get_settings", return_value=mock_settings
         ):
-            with patch("fastapi_auth.services.rbac.DatabaseSession") as mock_db_session:
+            with patch(
+                "fastapi_auth.services.rbac.get_database_session"
+            ) as mock_db_session:
                 mock_db_session_instance = MagicMock()
                 mock_db_session_instance.SessionLocal = MagicMock(
                     return_value=async_context_manager
@@ -826,7 +836,9 @@ class TestCheckRoleFromRequest:
         with patch(
             "fastapi_auth.services.rbac.get_settings", return_value=mock_settings
         ):
-            with patch("fastapi_auth.services.rbac.DatabaseSession") as mock_db_session:
+            with patch(
+                "fastapi_auth.services.rbac.get_database_session"
+            ) as mock_db_session:
                 mock_db_session_instance = MagicMock()
                 mock_db_session_instance.SessionLocal = MagicMock(
                     return_value=async_context_manager
@@ -878,7 +890,9 @@ class TestCheckRoleFromRequest:
         with patch(
             "fastapi_auth.services.rbac.get_settings", return_value=mock_settings
         ):
-            with patch("fastapi_auth.services.rbac.DatabaseSession") as mock_db_session:
+            with patch(
+                "fastapi_auth.services.rbac.get_database_session"
+            ) as mock_db_session:
                 mock_db_session_instance = MagicMock()
                 mock_db_session_instance.SessionLocal = MagicMock(
                     return_value=async_context_manager
@@ -939,7 +953,9 @@ class TestCheckPermissionsFromRequest:
         with patch(
             "fastapi_auth.services.rbac.get_settings", return_value=mock_settings
         ):
-            with patch("fastapi_auth.services.rbac.DatabaseSession") as mock_db_session:
+            with patch(
+                "fastapi_auth.services.rbac.get_database_session"
+            ) as mock_db_session:
                 mock_db_session_instance = MagicMock()
                 mock_db_session_instance.SessionLocal = MagicMock(
                     return_value=async_context_manager
@@ -995,7 +1011,9 @@ class TestCheckPermissionsFromRequest:
         with patch(
             "fastapi_auth.services.rbac.get_settings", return_value=mock_settings
         ):
-            with patch("fastapi_auth.services.rbac.DatabaseSession") as mock_db_session:
+            with patch(
+                "fastapi_auth.services.rbac.get_database_session"
+            ) as mock_db_session:
                 mock_db_session_instance = MagicMock()
                 mock_db_session_instance.SessionLocal = MagicMock(
                     return_value=async_context_manager
@@ -1052,7 +1070,9 @@ class TestCheckPermissionsFromRequest:
         with patch(
             "fastapi_auth.services.rbac.get_settings", return_value=mock_settings
         ):
-            with patch("fastapi_auth.services.rbac.DatabaseSession") as mock_db_session:
+            with patch(
+                "fastapi_auth.services.rbac.get_database_session"
+            ) as mock_db_session:
                 mock_db_session_instance = MagicMock()
                 mock_db_session_instance.SessionLocal = MagicMock(
                     return_value=async_context_manager
@@ -1108,9 +1128,9 @@ class TestSessionLogic:
                 "fastapi_auth.services.rbac.UserRepository",
                 return_value=mock_user_repo,
             ) as mock_user_repo_class:
-                # Mock DatabaseSession to verify it's NOT called
+                # Mock get_database_session to verify it's NOT called
                 with patch(
-                    "fastapi_auth.services.rbac.DatabaseSession"
+                    "fastapi_auth.services.rbac.get_database_session"
                 ) as mock_db_session:
                     result = await _get_user_from_request(request, session=mock_session)
 
@@ -1120,7 +1140,7 @@ class TestSessionLogic:
                     # Verify UserRepository was called with the provided session
                     mock_user_repo_class.assert_called_once_with(database=mock_session)
 
-                    # Verify DatabaseSession was NOT called (no new session created)
+                    # Verify no new session was created
                     mock_db_session.assert_not_called()
 
     @pytest.mark.asyncio
@@ -1152,7 +1172,9 @@ class TestSessionLogic:
         with patch(
             "fastapi_auth.services.rbac.get_settings", return_value=mock_settings
         ):
-            with patch("fastapi_auth.services.rbac.DatabaseSession") as mock_db_session:
+            with patch(
+                "fastapi_auth.services.rbac.get_database_session"
+            ) as mock_db_session:
                 mock_db_session_instance = MagicMock()
                 mock_db_session_instance.SessionLocal = MagicMock(
                     return_value=async_context_manager
@@ -1168,8 +1190,8 @@ class TestSessionLogic:
                     # Verify user was retrieved
                     assert result.email == user.email
 
-                    # Verify DatabaseSession was called to create a new session
-                    mock_db_session.assert_called_once_with(mock_settings)
+                    # Verify the shared DatabaseSession was used to open a session
+                    mock_db_session.assert_called_once_with()
                     mock_db_session_instance.SessionLocal.assert_called_once()
 
     @pytest.mark.asyncio
@@ -1205,7 +1227,9 @@ class TestSessionLogic:
         with patch(
             "fastapi_auth.services.rbac.get_settings", return_value=mock_settings
         ):
-            with patch("fastapi_auth.services.rbac.DatabaseSession") as mock_db_session:
+            with patch(
+                "fastapi_auth.services.rbac.get_database_session"
+            ) as mock_db_session:
                 mock_db_session_instance = MagicMock()
                 mock_db_session_instance.SessionLocal = MagicMock(
                     return_value=async_context_manager
@@ -1267,7 +1291,9 @@ class TestSessionLogic:
         with patch(
             "fastapi_auth.services.rbac.get_settings", return_value=mock_settings
         ):
-            with patch("fastapi_auth.services.rbac.DatabaseSession") as mock_db_session:
+            with patch(
+                "fastapi_auth.services.rbac.get_database_session"
+            ) as mock_db_session:
                 mock_db_session_instance = MagicMock()
                 mock_db_session_instance.SessionLocal = MagicMock(
                     return_value=async_context_manager
@@ -1330,7 +1356,9 @@ class TestSessionLogic:
         with patch(
             "fastapi_auth.services.rbac.get_settings", return_value=mock_settings
         ):
-            with patch("fastapi_auth.services.rbac.DatabaseSession") as mock_db_session:
+            with patch(
+                "fastapi_auth.services.rbac.get_database_session"
+            ) as mock_db_session:
                 mock_db_session_instance = MagicMock()
                 mock_db_session_instance.SessionLocal = MagicMock(
                     return_value=async_context_manager
@@ -180,6 +180,7 @@ class TestGithubSocialProviderLogin:
         mock_user_repo = AsyncMock()
         created_user = MagicMock()
         created_user.email = "test@example.com"
+        mock_user_repo.get_user_by_email = AsyncMock(return_value=None)
         mock_user_repo.create_user = AsyncMock(return_value=created_user)
 
         provider = GithubSocialProvider(mock_social_repo, mock_user_repo)
@@ -230,6 +231,39 @@ class TestGithubSocialProviderLogin:
         assert isinstance(result, UserJWTResponseSchema)
         assert result.access_token is not None
         assert result.refresh_token is not None
+        mock_user_repo.create_user.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_login_reuses_existing_user(self, mock_settings):
+        """Test login with a known email does not create another user."""
+        mock_social_repo = MagicMock()
+        mock_social_repo.get_social_provider_by_type = AsyncMock(
+            return_value=SocialProvider(
+                provider_type=SupportedProviders.GITHUB.value,
+                client_id="test_client_id",
+                client_secret="test_client_secret",
+            )
+        )
+
+        mock_user_repo = AsyncMock()
+        existing_user = MagicMock()
+        existing_user.email = "test@example.com"
+        mock_user_repo.get_user_by_email = AsyncMock(return_value=existing_user)
+
+        provider = GithubSocialProvider(mock_social_repo, mock_user_repo)
+        provider.settings = mock_settings
+        provider.exchange_code_for_token = AsyncMock(return_value="test_access_token")
+        github_user = MagicMock(email="test@example.com", avatar_url=None)
+        github_user.name = "Test User"
+        provider.get_user_info = AsyncMock(return_value=github_user)
+
+        result = await provider.login(code="test_code")
+
+        assert isinstance(result, UserJWTResponseSchema)
+        mock_user_repo.get_user_by_email.assert_awaited_once_with(
+            email="test@example.com"
+        )
+        mock_user_repo.create_user.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_login_with_missing_provider_settings(self):
@@ -1,5 +1,7 @@
 """Extended tests for user service covering missing paths."""
 
+from unittest.mock import patch
+
 import pytest
 from fastapi import HTTPException
 
@@ -128,10 +130,19 @@ class TestUserServiceExtended:
             email="nonexistent@example.com", password="password123"
         )
 
-        with pytest.raises(HTTPException) as exc_info:
+        with (
+            patch(
+                "fastapi_auth.services.user_service.verify_dummy_password",
+                return_value=False,
+            ) as mock_verify_dummy,
+            pytest.raises(HTTPException) as exc_info,
+        ):
             await service.log_user_in(login_schema)
-        assert exc_info.value.status_code == 404
-        assert "No user exists" in exc_info.value.detail
+        assert exc_info.value.status_code == 401
+        assert "Invalid credentials" in exc_info.value.detail
+        mock_verify_dummy.assert_called_once_with(
+            password="password123", settings=settings
+        )
 
     @pytest.mark.asyncio
     async def test_log_user_in_no_password(
@@ -190,3 +201,127 @@ class TestUserServiceExtended:
             await service.log_user_in(login_schema)
         assert exc_info.value.status_code == 401
         assert "Invalid credentials" in exc_info.value.detail
+
+    @pytest.mark.asyncio
+    async def test_signup_user_hashes_password_for_login(
+        self, test_session, test_settings
+    ):
+        """Test signup stores a hashed password that log_user_in accepts."""
+        settings = Settings(
+            database_url=test_settings.database_url,
+            jwt_secret_key=test_settings.jwt_secret_key,
+            encryption_key=test_settings.encryption_key,
+            passwordless_login_enabled=False,
+            email_verification_required=False,
+        )
+
+        from fastapi_auth.repositories.user_repository import UserRepository
+
+        repository = UserRepository(test_session)
+        service = UserService(repository=repository, settings=settings)
+
+        await service.signup_user(
+            UserSignupSchema(email="hashed@example.com", password="password123")
+        )
+
+        user = await repository.get_user_by_email(email="hashed@example.com")
+        assert user.password != "password123"
+
+        result = await service.log_user_in(
+            UserPasswordLoginSchema(email="hashed@example.com", password="password123")
+        )
+        assert result.access_token
+
+    @pytest.mark.asyncio
+    async def test_signup_and_login_normalize_email_case(
+        self, test_session, test_settings
+    ):
+        """Test emails are stored lowercased and matched regardless of case."""
+        settings = Settings(
+            database_url=test_settings.database_url,
+            jwt_secret_key=test_settings.jwt_secret_key,
+            encryption_key=test_settings.encryption_key,
+            passwordless_login_enabled=False,
+            email_verification_required=False,
+        )
+
+        from fastapi_auth.repositories.user_repository import UserRepository
+
+        repository = UserRepository(test_session)
+        service = UserService(repository=repository, settings=settings)
+
+        await service.signup_user(
+            UserSignupSchema(email="  Mixed.Case@Example.COM ", password="password123")
+        )
+
+        user = await repository.get_user_by_email(email="mixed.case@example.com")
+        assert user is not None
+        assert user.email == "mixed.case@example.com"
+
+        with pytest.raises(HTTPException) as exc_info:
+            await service.signup_user(
+                UserSignupSchema(email="MIXED.CASE@example.com", password="other")
+            )
+        assert exc_info.value.status_code == 400
+
+        result = await service.log_user_in(
+            UserPasswordLoginSchema(
+                email="Mixed.Case@example.com", password="password123"
+            )
+        )
+        assert result.access_token
+
+    @pytest.mark.asyncio
+    async def test_signup_user_lost_race_raises_error(
+        self, mock_user_repository, mock_settings
+    ):
+        """Test signup fails when the email is taken between lookup and insert."""
+        mock_user_repository.get_user_by_email.return_value = None
+        mock_user_repository.create_user.return_value = None
+        service = UserService(repository=mock_user_repository, settings=mock_settings)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await service.signup_user(UserSignupSchema(email="race@example.com"))
+        assert exc_info.value.status_code == 400
+        assert "User already exists" in exc_info.value.detail
+
+    @pytest.mark.asyncio
+    async def test_log_user_in_query_count(
+        self, test_engine, test_session, test_user, test_settings, mock_user_data
+    ):
+        """Test login runs a single SELECT even when the user has roles."""
+        from sqlalchemy import event
+
+        from fastapi_auth.models.rbac import Permission, Role, UserRole
+        from fastapi_auth.repositories.user_repository import UserRepository
+
+        permission = Permission(name="users:read", resource="users", action="read")
+        role = Role(name="editor", permissions=[permission])
+        test_session.add(role)
+        await test_session.commit()
+        test_session.add(UserRole(user_id=test_user.id, role_id=role.id))
+        await test_session.commit()
+        test_session.expunge_all()
+
+        statements = []
+
+        def count_statements(conn, cursor, statement, parameters, context, many):
+            statements.append(statement)
+
+        repository = UserRepository(test_session)
+        service = UserService(repository=repository, settings=test_settings)
+        login_schema = UserPasswordLoginSchema(
+            email=test_user.email, password=mock_user_data["password"]
+        )
+
+        event.listen(test_engine.sync_engine, "before_cursor_execute", count_statements)
+        try:
+            await service.log_user_in(login_schema)
+        finally:
+            event.remove(
+                test_engine.sync_engine, "before_cursor_execute", count_statements
+            )
+
+        selects = [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+        assert len(selects) == 1
+        assert "auth_user_roles" not in selects[0]
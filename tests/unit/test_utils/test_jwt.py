@@ -1,5 +1,6 @@
 import datetime
 from datetime import timedelta
+from unittest.mock import patch
 from zoneinfo import ZoneInfo
 
 import jwt
@@ -8,7 +9,13 @@ from fastapi import HTTPException
 
 from fastapi_auth.models.user import User
 from fastapi_auth.settings import Settings
-from fastapi_auth.utils.jwt import generate_jwt_token, verify_jwt_token
+from fastapi_auth.utils.jwt import (
+    _encode_jwt,
+    _token_cache,
+    generate_jwt_token,
+    verify_jwt_token,
+    verify_jwt_token_cached,
+)
 
 
 class TestGenerateJWTToken:
@@ -81,6 +88,30 @@ class TestGenerateJWTToken:
         assert abs(access_payload["exp"] - expected_access_exp.timestamp()) < 1
         assert abs(refresh_payload["exp"] - expected_refresh_exp.timestamp()) < 1
 
+    @pytest.mark.parametrize("algorithm", ["HS256", "HS384", "HS512"])
+    def test_encode_jwt_matches_pyjwt_for_hmac(self, mock_settings, algorithm):
+        """Test that HMAC tokens are identical to the ones PyJWT produces."""
+        settings = mock_settings.model_copy(update={"jwt_algorithm": algorithm})
+        payload = {"sub": "test@example.com", "aud": "test-audience", "exp": 2**31}
+
+        assert _encode_jwt(payload, settings) == jwt.encode(
+            payload, settings.jwt_secret_key, algorithm=algorithm
+        )
+
+    def test_encode_jwt_delegates_other_algorithms_to_pyjwt(self, mock_settings):
+        """Test that non-HMAC algorithms are signed by PyJWT."""
+        settings = mock_settings.model_copy(update={"jwt_algorithm": "RS256"})
+        payload = {"sub": "test@example.com"}
+
+        with patch(
+            "fastapi_auth.utils.jwt.jwt.encode", return_value="token"
+        ) as mock_encode:
+            assert _encode_jwt(payload, settings) == "token"
+
+        mock_encode.assert_called_once_with(
+            payload, settings.jwt_secret_key, algorithm="RS256"
+        )
+
 
 class TestVerifyJWTToken:
     """Test JWT token verification."""
@@ -142,3 +173,79 @@ class TestVerifyJWTToken:
             verify_jwt_token(token_data.access_token, wrong_settings)
 
         assert exc_info.value.status_code == 401
+
+
+class TestVerifyJWTTokenCached:
+    """Test cached JWT token verification."""
+
+    @pytest.fixture(autouse=True)
+    def clear_token_cache(self):
+        _token_cache.clear()
+        yield
+        _token_cache.clear()
+
+    def test_verify_jwt_token_cached_decodes_once(self, mock_settings):
+        """Test that a valid token is only decoded on the first call."""
+        user = User(email="test@example.com")
+        token_data = generate_jwt_token(user, mock_settings)
+
+        with patch(
+            "fastapi_auth.utils.jwt.jwt.decode", wraps=jwt.decode
+        ) as mock_decode:
+            first = verify_jwt_token_cached(
+                token_data.access_token, mock_settings, mock_settings.jwt_audience
+            )
+            second = verify_jwt_token_cached(
+                token_data.access_token, mock_settings, mock_settings.jwt_audience
+            )
+
+        assert first["sub"] == user.email
+        assert second == first
+        assert mock_decode.call_count == 1
+
+    def test_verify_jwt_token_cached_does_not_cache_invalid_tokens(self, mock_settings):
+        """Test that invalid tokens are re-checked on every call."""
+        with patch(
+            "fastapi_auth.utils.jwt.jwt.decode", wraps=jwt.decode
+        ) as mock_decode:
+            for _ in range(2):
+                with pytest.raises(jwt.InvalidTokenError):
+                    verify_jwt_token_cached("invalid.token.here", mock_settings)
+
+        assert mock_decode.call_count == 2
+        assert len(_token_cache) == 0
+
+    def test_verify_jwt_token_cached_is_keyed_by_secret(self, mock_settings):
+        """Test that a cached token is not accepted under a different secret."""
+        user = User(email="test@example.com")
+        token_data = generate_jwt_token(user, mock_settings)
+        verify_jwt_token_cached(
+            token_data.access_token, mock_settings, mock_settings.jwt_audience
+        )
+
+        wrong_settings = Settings(
+            database_url="sqlite+aiosqlite:///:memory:",
+            jwt_secret_key="wrong-secret-key",
+            jwt_algorithm=mock_settings.jwt_algorithm,
+        )
+
+        with pytest.raises(jwt.InvalidSignatureError):
+            verify_jwt_token_cached(
+                token_data.access_token, wrong_settings, mock_settings.jwt_audience
+            )
+
+    def test_verify_jwt_token_cached_expires_with_token(self, mock_settings):
+        """Test that cache entries do not outlive the token itself."""
+        tz = ZoneInfo(mock_settings.timezone)
+        payload = {
+            "sub": "test@example.com",
+            "exp": datetime.datetime.now(tz=tz) + timedelta(seconds=5),
+        }
+        token = jwt.encode(
+            payload, mock_settings.jwt_secret_key, algorithm=mock_settings.jwt_algorithm
+        )
+        verify_jwt_token_cached(token, mock_settings)
+
+        _token_cache.expire(_token_cache.timer() + 10)
+
+        assert len(_token_cache) == 0
@@ -1,15 +1,22 @@
 import bcrypt
+import pytest
+from pydantic import ValidationError
 
-from fastapi_auth.utils.password import hash_password, verify_password
+from fastapi_auth.utils.password import (
+    _get_dummy_hash,
+    hash_password,
+    verify_dummy_password,
+    verify_password,
+)
 
 
 class TestHashPassword:
     """Test password hashing functionality."""
 
-    def test_hash_password_generates_valid_bcrypt_hash(self):
+    def test_hash_password_generates_valid_bcrypt_hash(self, mock_settings):
         """Test that hash_password generates a valid bcrypt hash."""
         password = "test_password_123"
-        hashed = hash_password(password)
+        hashed = hash_password(password, mock_settings)
 
         # Check that it's a string (decoded from bytes)
         assert isinstance(hashed, str)
@@ -20,11 +27,11 @@ class TestHashPassword:
         # Verify the hash can be checked against the original password
         assert bcrypt.checkpw(password.encode(), hashed.encode())
 
-    def test_hash_password_different_hashes_for_same_password(self):
+    def test_hash_password_different_hashes_for_same_password(self, mock_settings):
         """Test that hashing the same password multiple times produces different hashes."""
         password = "test_password_123"
-        hash1 = hash_password(password)
-        hash2 = hash_password(password)
+        hash1 = hash_password(password, mock_settings)
+        hash2 = hash_password(password, mock_settings)
 
         # Hashes should be different due to salt
         assert hash1 != hash2
@@ -33,29 +40,66 @@ class TestHashPassword:
         assert bcrypt.checkpw(password.encode(), hash1.encode())
         assert bcrypt.checkpw(password.encode(), hash2.encode())
 
+    def test_hash_password_uses_configured_rounds(self, mock_settings):
+        """Test that hash_password uses the bcrypt rounds from settings."""
+        settings = mock_settings.model_copy(update={"bcrypt_rounds": 5})
+
+        hashed = hash_password("test_password_123", settings)
+
+        assert hashed.split("$")[2] == "05"
+        assert verify_password("test_password_123", hashed) is True
+
+    @pytest.mark.parametrize("rounds", [3, 32])
+    def test_bcrypt_rounds_outside_bcrypt_range_rejected(self, mock_settings, rounds):
+        """Test settings reject work factors bcrypt.gensalt would refuse."""
+        with pytest.raises(ValidationError):
+            mock_settings.model_validate(
+                {**mock_settings.model_dump(), "bcrypt_rounds": rounds}
+            )
+
 
 class TestVerifyPassword:
     """Test password verification functionality."""
 
-    def test_verify_password_with_correct_password(self):
+    def test_verify_password_with_correct_password(self, mock_settings):
         """Test verify_password with correct password."""
         password = "test_password_123"
-        hashed = hash_password(password)
+        hashed = hash_password(password, mock_settings)
 
         assert verify_password(password, hashed) is True
 
-    def test_verify_password_with_incorrect_password(self):
+    def test_verify_password_with_incorrect_password(self, mock_settings):
         """Test verify_password with incorrect password."""
         password = "test_password_123"
         wrong_password = "wrong_password"
-        hashed = hash_password(password)
+        hashed = hash_password(password, mock_settings)
 
         assert verify_password(wrong_password, hashed) is False
 
-    def test_verify_password_with_different_hash(self):
+    def test_verify_password_with_different_hash(self, mock_settings):
         """Test verify_password with hash from different password."""
         password1 = "test_password_123"
         password2 = "different_password"
-        hashed1 = hash_password(password1)
+        hashed1 = hash_password(password1, mock_settings)
 
         assert verify_password(password2, hashed1) is False
+
+
+class TestVerifyDummyPassword:
+    """Test the timing-equalizing dummy password check."""
+
+    def test_verify_dummy_password_always_fails(self, mock_settings):
+        """Test verify_dummy_password never accepts a password."""
+        assert verify_dummy_password("dummy-password", mock_settings) is False
+        assert verify_dummy_password("test_password_123", mock_settings) is False
+
+    def test_dummy_hash_is_computed_once_per_work_factor(self, mock_settings):
+        """Test the dummy hash is reused and matches the configured rounds."""
+        settings = mock_settings.model_copy(update={"bcrypt_rounds": 5})
+        _get_dummy_hash.cache_clear()
+
+        verify_dummy_password("first", settings)
+        verify_dummy_password("second", settings)
+
+        assert _get_dummy_hash.cache_info().misses == 1
+        assert _get_dummy_hash(5).split("$")[2] == "05"